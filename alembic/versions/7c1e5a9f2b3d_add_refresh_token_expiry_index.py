@@ -0,0 +1,35 @@
+"""add partial index on active refresh token expiry
+
+Revision ID: 7c1e5a9f2b3d
+Revises: 34fcd61c94a9
+Create Date: 2026-10-15 09:12:41.538104
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e5a9f2b3d"
+down_revision: str | Sequence[str] | None = "34fcd61c94a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_refresh_tokens_expires_at_active",
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("is_revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_tokens_expires_at_active", table_name="refresh_tokens")
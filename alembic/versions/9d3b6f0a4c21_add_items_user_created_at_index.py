@@ -0,0 +1,32 @@
+"""add composite index on items user_id and created_at
+
+Revision ID: 9d3b6f0a4c21
+Revises: 7c1e5a9f2b3d
+Create Date: 2026-10-15 11:04:27.310582
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3b6f0a4c21"
+down_revision: str | Sequence[str] | None = "7c1e5a9f2b3d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_items_user_created_at",
+        "items",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_items_user_created_at", table_name="items")
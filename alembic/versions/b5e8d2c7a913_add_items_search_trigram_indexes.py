@@ -0,0 +1,44 @@
+"""add trigram indexes for item name and description search
+
+Revision ID: b5e8d2c7a913
+Revises: 9d3b6f0a4c21
+Create Date: 2026-10-15 14:22:51.804417
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e8d2c7a913"
+down_revision: str | Sequence[str] | None = "9d3b6f0a4c21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_items_name_trgm",
+        "items",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_items_description_trgm",
+        "items",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_items_description_trgm", table_name="items")
+    op.drop_index("ix_items_name_trgm", table_name="items")
@@ -0,0 +1,39 @@
+"""add id to the items user_id/created_at index for keyset pagination
+
+Revision ID: e2a7c4f19b60
+Revises: b5e8d2c7a913
+Create Date: 2026-10-15 15:08:13.529804
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c4f19b60"
+down_revision: str | Sequence[str] | None = "b5e8d2c7a913"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_items_user_created_at_id",
+        "items",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_items_user_created_at", table_name="items")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_items_user_created_at",
+        "items",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_items_user_created_at_id", table_name="items")
@@ -1,6 +1,6 @@
 from fastapi_users.authentication import AuthenticationBackend, CookieTransport, JWTStrategy
 
-from app.config import settings
+from app.config import COOKIE_SAMESITE, COOKIE_SECURE, settings
 
 ACCESS_TOKEN_LIFETIME = 900  # 15 minutes
 
@@ -9,14 +9,18 @@ cookie_transport = CookieTransport(
     cookie_max_age=ACCESS_TOKEN_LIFETIME,
     cookie_path="/",
     cookie_domain=settings.cookie_domain,
-    cookie_secure=not settings.is_development,
+    cookie_secure=COOKIE_SECURE,
     cookie_httponly=True,
-    cookie_samesite=settings.cookie_samesite,
+    cookie_samesite=COOKIE_SAMESITE,
 )
 
 
+# Secret and lifetime are fixed for the process, so one strategy serves every request
+_jwt_strategy = JWTStrategy(secret=settings.secret_key, lifetime_seconds=ACCESS_TOKEN_LIFETIME)
+
+
 def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=settings.secret_key, lifetime_seconds=ACCESS_TOKEN_LIFETIME)
+    return _jwt_strategy
 
 
 auth_backend = AuthenticationBackend(
@@ -1,48 +1,89 @@
+import contextlib
+import hmac
 import logging
 import secrets
 from urllib.parse import urlencode
 
+import httpx
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse
 from httpx_oauth.clients.google import GoogleOAuth2
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.backend import ACCESS_TOKEN_LIFETIME, get_jwt_strategy
+from app.auth.rate_limit import rate_limit
 from app.auth.refresh import create_refresh_token, set_refresh_cookie
 from app.auth.security_logging import SecurityEvent, log_security_event
 from app.auth.users import UserManager, get_user_manager
-from app.config import settings
-from app.database import async_session_maker
+from app.config import COOKIE_SAMESITE, COOKIE_SECURE, IS_DEV, settings
+from app.database import get_async_session
 
 logger = logging.getLogger(__name__)
 
 CSRF_COOKIE_NAME = "fastapiusersoauthcsrf"
 GOOGLE_SCOPES = ["openid", "email", "profile"]
 
-google_oauth_client = GoogleOAuth2(
+# Shared across OAuth calls so the token exchange and profile lookup reuse
+# pooled keep-alive connections instead of a fresh TLS handshake per call.
+_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    timeout=10.0,
+)
+
+
+class _PooledGoogleOAuth2(GoogleOAuth2):
+    """GoogleOAuth2 client that reuses the module-level httpx client."""
+
+    def get_httpx_client(self) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+        # nullcontext so httpx_oauth's `async with` doesn't close the shared client
+        return contextlib.nullcontext(_http_client)
+
+
+google_oauth_client = _PooledGoogleOAuth2(
     client_id=settings.google_client_id,
     client_secret=settings.google_client_secret,
 )
 
+
+async def close_oauth_http_client() -> None:
+    """Close the shared OAuth HTTP client (called on app shutdown)."""
+    await _http_client.aclose()
+
+
 google_oauth_router = APIRouter(prefix="/auth/google", tags=["auth"])
 
+_LOGIN_URL = f"{settings.frontend_url}/login"
+
+
+# Callback URL per request base URL. Bounded because the Host header is client-controlled.
+_callback_urls: dict[str, str] = {}
+_CALLBACK_URL_CACHE_SIZE = 16
+
 
 def _get_callback_url(request: Request) -> str:
-    """Build the OAuth callback URL, respecting reverse proxy headers."""
-    url = str(request.url_for("google_callback"))
-    if not settings.is_development and url.startswith("http://"):
-        url = "https://" + url[len("http://") :]
+    """Build the OAuth callback URL, respecting reverse proxy headers.
+
+    The route reverse lookup only runs on the first request for each base URL.
+    """
+    base_url = str(request.base_url)
+    url = _callback_urls.get(base_url)
+    if url is None:
+        url = str(request.url_for("google_callback"))
+        if not IS_DEV and url.startswith("http://"):
+            url = "https://" + url[len("http://") :]
+        if len(_callback_urls) < _CALLBACK_URL_CACHE_SIZE:
+            _callback_urls[base_url] = url
     return url
 
 
 def _login_redirect(error: str | None = None) -> RedirectResponse:
     """Build a redirect to the frontend login page, optionally with an error."""
-    url = f"{settings.frontend_url}/login"
-    if error:
-        url += f"?{urlencode({'error': error})}"
-    return RedirectResponse(url=url, status_code=302)
+    if error is None:
+        return RedirectResponse(url=_LOGIN_URL, status_code=302)
+    return RedirectResponse(url=f"{_LOGIN_URL}?{urlencode({'error': error})}", status_code=302)
 
 
-@google_oauth_router.get("/authorize")
+@google_oauth_router.get("/authorize", dependencies=[Depends(rate_limit("10/minute"))])
 async def google_authorize(request: Request):
     """Redirect user to Google's OAuth consent screen."""
     if not settings.google_client_id:
@@ -64,16 +105,17 @@ async def google_authorize(request: Request):
         max_age=300,  # 5 minutes
         path="/",
         httponly=True,
-        secure=not settings.is_development,
-        samesite=settings.cookie_samesite,
+        secure=COOKIE_SECURE,
+        samesite=COOKIE_SAMESITE,
     )
     return response
 
 
-@google_oauth_router.get("/callback")
+@google_oauth_router.get("/callback", dependencies=[Depends(rate_limit("10/minute"))])
 async def google_callback(
     request: Request,
     user_manager: UserManager = Depends(get_user_manager),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Handle Google's OAuth callback — exchange code, create/link user, set cookies."""
     code = request.query_params.get("code")
@@ -100,7 +142,7 @@ async def google_callback(
         return _login_redirect(error="oauth_failed")
 
     # CSRF check
-    if not csrf_cookie or csrf_cookie != state:
+    if not csrf_cookie or not hmac.compare_digest(csrf_cookie.encode(), state.encode()):
         log_security_event(
             SecurityEvent.OAUTH_LOGIN_FAILURE,
             request=request,
@@ -172,15 +214,14 @@ async def google_callback(
         max_age=ACCESS_TOKEN_LIFETIME,
         path="/",
         domain=settings.cookie_domain,
-        secure=not settings.is_development,
+        secure=COOKIE_SECURE,
         httponly=True,
-        samesite=settings.cookie_samesite,
+        samesite=COOKIE_SAMESITE,
     )
 
-    # Create and set refresh token
-    async with async_session_maker() as session:
-        refresh_jwt = await create_refresh_token(str(user.id), session)
-        set_refresh_cookie(response, refresh_jwt)
+    # Create and set refresh token (same session the user manager used)
+    refresh_jwt = await create_refresh_token(str(user.id), session)
+    set_refresh_cookie(response, refresh_jwt)
 
     # Clear CSRF cookie
     response.delete_cookie(key=CSRF_COOKIE_NAME, path="/")
@@ -0,0 +1,49 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Request, status
+from limits import parse
+from limits.aio.strategies import MovingWindowRateLimiter
+from limits.storage import storage_from_string
+
+from app.auth.security_logging import SecurityEvent, log_security_event
+from app.config import settings
+
+
+def _async_storage_uri(uri: str) -> str:
+    """Map a storage URI such as "redis://..." to the async variant of its backend."""
+    return uri if uri.startswith("async+") else f"async+{uri}"
+
+
+# Redis-backed storage uses redis-py's asyncio client (installed via limits[redis])
+storage = storage_from_string(
+    _async_storage_uri(settings.rate_limit_storage_uri), implementation="redispy"
+)
+limiter = MovingWindowRateLimiter(storage)
+
+
+def rate_limit(limit: str) -> Callable[[Request], Awaitable[None]]:
+    """Build a route dependency that limits each client to ``limit`` (e.g. "5/minute").
+
+    Attached per route, so requests to unlimited endpoints never touch the limiter.
+    """
+    item = parse(limit)
+
+    async def dependency(request: Request) -> None:
+        scope = request.scope
+        path = scope["path"]
+        # Client IP, falling back to localhost when the server doesn't report one
+        client = scope.get("client")
+        key = client[0] if client else "127.0.0.1"
+        # Path is part of the key so routes sharing the same limit keep separate counters
+        if not await limiter.hit(item, key, path):
+            log_security_event(
+                SecurityEvent.RATE_LIMIT_HIT,
+                request=request,
+                detail=f"path={path}",
+            )
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+            )
+
+    return dependency
@@ -1,26 +1,44 @@
+import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
 
 from fastapi import Response
 from fastapi_users.jwt import decode_jwt, generate_jwt
-from sqlalchemy import select, update
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
+from app.config import COOKIE_SAMESITE, COOKIE_SECURE, settings
 from app.models.refresh_token import RefreshToken
 
 REFRESH_TOKEN_LIFETIME = timedelta(days=7)
 REFRESH_COOKIE_NAME = "trove_refresh"
 REFRESH_AUDIENCE = ["trove:refresh"]
 
+# Every refresh cookie attribute except the value is fixed for the process, so the
+# Set-Cookie header is prebuilt (same attribute order Starlette's set_cookie emits).
+_REFRESH_COOKIE_PREFIX = f"{REFRESH_COOKIE_NAME}=".encode("latin-1")
+_REFRESH_COOKIE_SUFFIX = "".join(
+    [
+        f"; Domain={settings.cookie_domain}" if settings.cookie_domain else "",
+        "; HttpOnly",
+        f"; Max-Age={int(REFRESH_TOKEN_LIFETIME.total_seconds())}",
+        "; Path=/auth/refresh",
+        f"; SameSite={COOKIE_SAMESITE}",
+        "; Secure" if COOKIE_SECURE else "",
+    ]
+).encode("latin-1")
+
 
 async def create_refresh_token(
     user_id: str,
     session: AsyncSession,
     family: str | None = None,
+    commit: bool = True,
 ) -> str:
-    token_id = uuid.uuid4()
-    token_family = family or uuid.uuid4().hex
+    # One random read covers the token id and, for a new family, the family id
+    rnd = secrets.token_bytes(16 if family else 32)
+    token_id = uuid.UUID(bytes=rnd[:16], version=4)
+    token_family = family or rnd[16:].hex()
     expires_at = datetime.now(UTC) + REFRESH_TOKEN_LIFETIME
 
     db_token = RefreshToken(
@@ -31,7 +49,8 @@ async def create_refresh_token(
         expires_at=expires_at,
     )
     session.add(db_token)
-    await session.commit()
+    if commit:
+        await session.commit()
 
     jwt_data = {
         "sub": user_id,
@@ -66,15 +85,18 @@ async def validate_and_rotate_refresh_token(
     if not jti or not user_id or not family:
         return None
 
-    # Look up the token in DB
-    result = await session.execute(select(RefreshToken).where(RefreshToken.id == uuid.UUID(jti)))
-    db_token = result.scalar_one_or_none()
-
-    if db_token is None:
-        return None
+    # Atomically revoke the presented token. The database decides the winner, so
+    # concurrent refreshes with the same token cannot both pass the revocation check.
+    result = await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == uuid.UUID(jti), RefreshToken.is_revoked.is_(False))
+        .values(is_revoked=True)
+        .returning(RefreshToken.expires_at)
+    )
+    expires_at = result.scalar_one_or_none()
 
-    # If revoked, this is a reuse — revoke the entire family (theft detection)
-    if db_token.is_revoked:
+    # Missing or already revoked — treat as reuse and revoke the entire family (theft detection)
+    if expires_at is None:
         await session.execute(
             update(RefreshToken).where(RefreshToken.token_family == family).values(is_revoked=True)
         )
@@ -82,29 +104,19 @@ async def validate_and_rotate_refresh_token(
         return None
 
     # Check expiration
-    if db_token.expires_at.replace(tzinfo=UTC) < datetime.now(UTC):
+    if expires_at.replace(tzinfo=UTC) < datetime.now(UTC):
         return None
 
-    # Revoke the current token
-    db_token.is_revoked = True
-    await session.flush()
-
-    # Issue a new token in the same family
-    new_jwt = await create_refresh_token(user_id, session, family=family)
+    # Issue a new token in the same family, committed together with the revoke
+    new_jwt = await create_refresh_token(user_id, session, family=family, commit=False)
+    await session.commit()
 
     return (user_id, new_jwt)
 
 
 def set_refresh_cookie(response: Response, jwt: str) -> None:
-    response.set_cookie(
-        key=REFRESH_COOKIE_NAME,
-        value=jwt,
-        max_age=int(REFRESH_TOKEN_LIFETIME.total_seconds()),
-        path="/auth/refresh",
-        domain=settings.cookie_domain,
-        secure=not settings.is_development,
-        httponly=True,
-        samesite=settings.cookie_samesite,
+    response.raw_headers.append(
+        (b"set-cookie", _REFRESH_COOKIE_PREFIX + jwt.encode("latin-1") + _REFRESH_COOKIE_SUFFIX)
     )
 
 
@@ -113,21 +125,18 @@ def clear_refresh_cookie(response: Response) -> None:
         key=REFRESH_COOKIE_NAME,
         path="/auth/refresh",
         domain=settings.cookie_domain,
-        secure=not settings.is_development,
+        secure=COOKIE_SECURE,
         httponly=True,
-        samesite=settings.cookie_samesite,
+        samesite=COOKIE_SAMESITE,
     )
 
 
 async def cleanup_expired_tokens(session: AsyncSession) -> int:
     result = await session.execute(
-        select(RefreshToken).where(
-            (RefreshToken.expires_at < datetime.now(UTC)) | (RefreshToken.is_revoked == True)  # noqa: E712
-        )
+        delete(RefreshToken).where(
+            (RefreshToken.expires_at < datetime.now(UTC)) | (RefreshToken.is_revoked.is_(True))
+        ),
+        execution_options={"synchronize_session": False},
     )
-    tokens = result.scalars().all()
-    count = len(tokens)
-    for token in tokens:
-        await session.delete(token)
     await session.commit()
-    return count
+    return result.rowcount
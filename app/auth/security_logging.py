@@ -17,6 +17,9 @@ class SecurityEvent(StrEnum):
     RATE_LIMIT_HIT = "RATE_LIMIT_HIT"
 
 
+_PREFIX = {event: f"[{event.value}]" for event in SecurityEvent}
+
+
 def log_security_event(
     event: SecurityEvent,
     *,
@@ -25,6 +28,9 @@ def log_security_event(
     email: str | None = None,
     detail: str | None = None,
 ) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     ip = None
     user_agent = None
     if request is not None:
@@ -39,14 +45,15 @@ def log_security_event(
         "email": email,
     }
 
-    message = f"[{event.value}]"
+    parts = [_PREFIX[event]]
     if email:
-        message += f" email={email}"
+        parts.append(f"email={email}")
     if user_id:
-        message += f" user_id={user_id}"
+        parts.append(f"user_id={user_id}")
     if ip:
-        message += f" ip={ip}"
+        parts.append(f"ip={ip}")
     if detail:
-        message += f" {detail}"
+        parts.append(detail)
+    message = " ".join(parts)
 
     logger.info(message, extra=extra)
@@ -1,10 +1,11 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
 from fastapi import Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, models
+from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, exceptions, models
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +13,7 @@ from app.auth.backend import auth_backend
 from app.auth.refresh import create_refresh_token, set_refresh_cookie
 from app.auth.security_logging import SecurityEvent, log_security_event
 from app.config import settings
-from app.database import async_session_maker, get_async_session
+from app.database import get_async_session
 from app.models.oauth_account import OAuthAccount
 from app.models.user import User
 
@@ -50,15 +51,35 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
             email=user.email,
         )
         if response is not None:
-            async with async_session_maker() as session:
-                refresh_jwt = await create_refresh_token(str(user.id), session)
-                set_refresh_cookie(response, refresh_jwt)
+            refresh_jwt = await create_refresh_token(str(user.id), self.user_db.session)
+            set_refresh_cookie(response, refresh_jwt)
 
     async def authenticate(
         self,
         credentials: OAuth2PasswordRequestForm,
     ) -> models.UP | None:
-        user = await super().authenticate(credentials)
+        """Authenticate by email and password.
+
+        Mirrors BaseUserManager.authenticate, but runs the CPU-bound password
+        hashing in a worker thread so logins don't block the event loop.
+        """
+        user = None
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Run the hasher anyway to mitigate timing attacks
+            await asyncio.to_thread(self.password_helper.hash, credentials.password)
+        else:
+            verified, updated_password_hash = await asyncio.to_thread(
+                self.password_helper.verify_and_update,
+                credentials.password,
+                user.hashed_password,
+            )
+            if not verified:
+                user = None
+            elif updated_password_hash is not None:
+                await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
         if user is None:
             log_security_event(
                 SecurityEvent.LOGIN_FAILURE,
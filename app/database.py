@@ -1,20 +1,53 @@
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Seconds to spend filling the pool at startup before serving requests anyway
+WARM_POOL_TIMEOUT = 5
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
-    pass
+    # Fetch server-generated values (created_at, updated_at) with RETURNING during the
+    # INSERT/UPDATE itself, so handlers don't need a refresh SELECT afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
 
+_pool_options: dict[str, Any]
+if settings.db_pgbouncer:
+    # PgBouncer owns the pool. Its server connections are shared between clients, so
+    # asyncpg must not cache prepared statements or reuse their names.
+    _pool_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    _pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        # Recycle before typical server/proxy idle timeouts drop the connection
+        "pool_recycle": 1800,
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.is_development,
+    **_pool_options,
 )
 
 async_session_maker = async_sessionmaker(
@@ -28,3 +61,29 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides an async database session."""
     async with async_session_maker() as session:
         yield session
+
+
+async def warm_pool() -> None:
+    """Open the pool's base connections up front so early requests skip the connect cost."""
+    if settings.db_pgbouncer:
+        # No local pool to fill; PgBouncer keeps its own server connections open
+        return
+
+    async def connect() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Failures are not fatal: connections are still opened on demand once the database is
+    # reachable. The timeout keeps an unreachable database from delaying startup.
+    try:
+        async with asyncio.timeout(WARM_POOL_TIMEOUT):
+            results = await asyncio.gather(
+                *(connect() for _ in range(settings.db_pool_size)), return_exceptions=True
+            )
+    except TimeoutError:
+        logger.warning("Database connection pool warm-up timed out")
+        return
+
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Database connection pool warm-up failed", exc_info=result)
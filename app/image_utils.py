@@ -1,14 +1,24 @@
+import os
+
 from fastapi import HTTPException, UploadFile, status
 
-ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
+CONTENT_TYPE_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+ALLOWED_CONTENT_TYPES = set(CONTENT_TYPE_EXTENSIONS)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_ITEM_IMAGES = 10
 MAX_MARK_IMAGES = 3
 
 
-async def validate_image_file(file: UploadFile) -> bytes:
-    """Validate an uploaded image file and return its contents.
+def extension_from_content_type(content_type: str | None) -> str:
+    """Return the file extension for an image content type, or ``.bin`` if unknown."""
+    return CONTENT_TYPE_EXTENSIONS.get(content_type or "", ".bin")
+
+
+async def validate_image_file(file: UploadFile) -> int:
+    """Validate an uploaded image file and return its size in bytes.
 
+    The upload is measured where it was spooled instead of being read into memory,
+    so it can be streamed to storage from ``file.file``.
     Raises HTTPException if the file is invalid.
     """
     if file.content_type not in ALLOWED_CONTENT_TYPES:
@@ -17,18 +27,19 @@ async def validate_image_file(file: UploadFile) -> bytes:
             detail=f"File type '{file.content_type}' not allowed. Allowed types: JPEG, PNG, WebP",
         )
 
-    data = await file.read()
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(0)
 
-    if len(data) > MAX_FILE_SIZE:
+    if size > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB",
         )
 
-    if len(data) == 0:
+    if size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File is empty",
         )
 
-    return data
+    return size
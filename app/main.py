@@ -1,15 +1,16 @@
-from fastapi import Depends, FastAPI, Request, Response
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from limits import RateLimitItem, parse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.auth import auth_backend, current_active_user, fastapi_users
-from app.auth.oauth import google_oauth_router
-from app.auth.security_logging import SecurityEvent, log_security_event
+from app.auth.oauth import close_oauth_http_client, google_oauth_router
+from app.auth.rate_limit import rate_limit
 from app.config import settings
+from app.database import warm_pool
+from app.middleware import HealthCheckMiddleware, SecurityHeadersMiddleware
 from app.models.user import User
 from app.routers import (
     collection_types_router,
@@ -23,12 +24,24 @@ from app.routers import (
     tags_router,
 )
 from app.routers.auth_refresh import router as auth_refresh_router
+from app.routers.items import NEXT_CURSOR_HEADER
 from app.schemas.user import UserCreate, UserRead
+from app.storage import close_storage_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await warm_pool()
+    yield
+    await close_oauth_http_client()
+    await close_storage_client()
+
 
 app = FastAPI(
     title="Trove API",
     description="Personal collection management API for tracking antiques, art, and valuables",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -38,25 +51,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-# Rate limiting
-limiter = Limiter(key_func=get_remote_address)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # --- Auth routes ---
 # Custom refresh/logout routes (included before FastAPI-Users so /auth/jwt/logout is shadowed)
 app.include_router(auth_refresh_router)
+# The limit also covers FastAPI-Users' logout route, but that one is shadowed above
 app.include_router(
     fastapi_users.get_auth_router(auth_backend),
     prefix="/auth/jwt",
     tags=["auth"],
+    dependencies=[Depends(rate_limit("5/minute"))],
 )
 app.include_router(
     fastapi_users.get_register_router(UserRead, UserCreate),
     prefix="/auth",
     tags=["auth"],
+    dependencies=[Depends(rate_limit("3/minute"))],
 )
 app.include_router(google_oauth_router)
 # --- End auth routes ---
@@ -67,49 +79,14 @@ async def get_current_user(user: User = Depends(current_active_user)):
     return user
 
 
-# Path-specific rate limits for auth endpoints
-_AUTH_RATE_LIMITS: dict[str, RateLimitItem] = {
-    "/auth/jwt/login": parse("5/minute"),
-    "/auth/register": parse("3/minute"),
-    "/auth/refresh": parse("30/minute"),
-    "/auth/google/authorize": parse("10/minute"),
-    "/auth/google/callback": parse("10/minute"),
-}
-
-# OAuth endpoints use GET instead of POST
-_OAUTH_PATHS = {"/auth/google/authorize", "/auth/google/callback"}
-
-
-@app.middleware("http")
-async def rate_limit_auth(request: Request, call_next) -> Response:
-    """Apply rate limits to auth endpoints."""
-    rate_limit = _AUTH_RATE_LIMITS.get(request.url.path)
-    is_oauth = request.url.path in _OAUTH_PATHS
-    if rate_limit and (request.method == "POST" or is_oauth):
-        key = get_remote_address(request)
-        if not limiter._limiter.hit(rate_limit, key):
-            log_security_event(
-                SecurityEvent.RATE_LIMIT_HIT,
-                request=request,
-                detail=f"path={request.url.path}",
-            )
-            return JSONResponse(
-                status_code=429,
-                content={"detail": "Rate limit exceeded"},
-            )
-    return await call_next(request)
-
-
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next) -> Response:
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    return response
+# Compress JSON responses of 1 KiB or more; level 5 keeps CPU cost low for most of the gain
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Wraps the app and the middleware above, including 429 and CORS preflight responses
+app.add_middleware(SecurityHeadersMiddleware)
+
+# Outermost: health probes (GET / and /health) get a prebuilt response and skip the app entirely
+app.add_middleware(HealthCheckMiddleware)
 
 
 # API routes
@@ -122,15 +99,3 @@ app.include_router(item_images_router)
 app.include_router(mark_images_router)
 app.include_router(provenance_router)
 app.include_router(item_notes_router)
-
-
-@app.get("/")
-async def root():
-    """Health check endpoint."""
-    return {"status": "ok", "message": "Trove API"}
-
-
-@app.get("/health")
-async def health_check():
-    """Detailed health check."""
-    return {"status": "healthy"}
@@ -0,0 +1,74 @@
+"""Pure ASGI middleware.
+
+Written against the raw ASGI interface rather than ``@app.middleware("http")``
+so each request avoids the extra task and Request/Response wrapping that
+Starlette's BaseHTTPMiddleware adds.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"strict-transport-security", b"max-age=63072000; includeSubDomains"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"x-permitted-cross-domain-policies", b"none"),
+    (b"permissions-policy", b"camera=(), microphone=(), geolocation=()"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Append static security headers to every HTTP response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def _json_response(body: bytes) -> tuple[Message, Message]:
+    start: Message = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            *_SECURITY_HEADERS,
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+_HEALTH_RESPONSES: dict[str, tuple[Message, Message]] = {
+    "/": _json_response(b'{"status":"ok","message":"Trove API"}'),
+    "/health": _json_response(b'{"status":"healthy"}'),
+}
+
+
+class HealthCheckMiddleware:
+    """Answer GET health checks directly, without running the rest of the stack."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            response = _HEALTH_RESPONSES.get(scope["path"])
+            if response is not None:
+                start, body = response
+                # Copy the start message: servers may modify its header list in place
+                await send({**start, "headers": list(start["headers"])})
+                await send(body)
+                return
+
+        await self.app(scope, receive, send)
@@ -2,7 +2,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
-from sqlalchemy import JSON, Date, DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, Numeric, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -73,37 +73,57 @@ class Item(Base):
         nullable=False,
     )
 
-    # Relationships
+    # Relationships (not eager-loaded; queries that need them opt in with loader options).
+    # Child rows and tag links are removed by ON DELETE CASCADE, so deletes never load them.
     user = relationship("User", back_populates="items")
-    collection = relationship("Collection", back_populates="items", lazy="selectin")
-    tags = relationship("Tag", secondary=item_tags, back_populates="items", lazy="selectin")
+    collection = relationship("Collection", back_populates="items")
+    tags = relationship("Tag", secondary=item_tags, back_populates="items", passive_deletes=True)
     marks = relationship(
         "Mark",
         back_populates="item",
-        lazy="selectin",
         order_by="Mark.created_at",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     provenance_entries = relationship(
         "ProvenanceEntry",
         back_populates="item",
-        lazy="selectin",
         order_by="ProvenanceEntry.created_at",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     item_notes = relationship(
         "ItemNote",
         back_populates="item",
-        lazy="selectin",
         order_by="ItemNote.created_at",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     images = relationship(
         "Image",
         back_populates="item",
-        lazy="selectin",
         order_by="Image.position",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Serves the item list query (filter by user, newest first, keyset-paginated on
+        # created_at then id) without a sort step
+        Index("ix_items_user_created_at_id", "user_id", "created_at", "id"),
+        # Trigram indexes let PostgreSQL serve the %term% ILIKE search without a full scan
+        Index(
+            "ix_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_items_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     @property
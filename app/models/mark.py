@@ -46,6 +46,7 @@ class Mark(Base):
         lazy="selectin",
         order_by="Image.position",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
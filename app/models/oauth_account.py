@@ -1,7 +1,17 @@
+import uuid
+
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseOAuthAccountTableUUID
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
 
 class OAuthAccount(SQLAlchemyBaseOAuthAccountTableUUID, Base):
     """Stores linked OAuth provider accounts (Google, etc.)."""
+
+    # Matches the User.id column type
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user.id", ondelete="cascade"), nullable=False
+    )
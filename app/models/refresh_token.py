@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,3 +24,13 @@ class RefreshToken(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+    __table_args__ = (
+        # Partial index for cleanup of expired-but-active tokens; stays small because
+        # revoked rows are excluded and periodically deleted.
+        Index(
+            "ix_refresh_tokens_expires_at_active",
+            "expires_at",
+            postgresql_where=text("is_revoked = false"),
+        ),
+    )
@@ -50,7 +50,8 @@ class Tag(Base):
 
     # Relationships
     user = relationship("User", back_populates="tags")
-    items = relationship("Item", secondary=item_tags, back_populates="tags", lazy="selectin")
+    # Links are removed by ON DELETE CASCADE, so deleting a tag never loads its items
+    items = relationship("Item", secondary=item_tags, back_populates="tags", passive_deletes=True)
 
     __table_args__ = (UniqueConstraint("user_id", "name", name="uq_tags_user_name"),)
 
@@ -1,5 +1,8 @@
+import uuid
+
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTableUUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -16,6 +19,10 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     - is_verified: email verification status
     """
 
+    # Same UUID type as the tables referencing user.id, so the stored values match on every
+    # dialect (FastAPI-Users' GUID falls back to hyphenated CHAR(36) outside Postgres)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
     oauth_accounts = relationship("OAuthAccount", lazy="joined")
     collections = relationship("Collection", back_populates="user", cascade="all, delete-orphan")
     items = relationship("Item", back_populates="user", cascade="all, delete-orphan")
@@ -7,6 +7,7 @@ from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.backend import cookie_transport, get_jwt_strategy
+from app.auth.rate_limit import rate_limit
 from app.auth.refresh import (
     REFRESH_AUDIENCE,
     clear_refresh_cookie,
@@ -22,7 +23,7 @@ from app.models.refresh_token import RefreshToken
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/refresh", status_code=204)
+@router.post("/refresh", status_code=204, dependencies=[Depends(rate_limit("30/minute"))])
 async def refresh_access_token(
     trove_refresh: str | None = Cookie(None),
     session: AsyncSession = Depends(get_async_session),
@@ -1,11 +1,15 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse, Response
 
 from app.type_registry import get_all_types
 
 router = APIRouter(tags=["collection-types"])
 
+# The registry is static, so the response body is serialized once at import
+_COLLECTION_TYPES_BODY = JSONResponse(get_all_types()).body
+
 
 @router.get("/collection-types")
 async def list_collection_types():
     """Return all available collection types and their field definitions."""
-    return get_all_types()
+    return Response(content=_COLLECTION_TYPES_BODY, media_type="application/json")
@@ -19,6 +19,24 @@ from app.schemas.collection import (
 router = APIRouter(prefix="/collections", tags=["collections"])
 
 
+# Per-collection aggregates as correlated subqueries, so each is answered from the
+# items.collection_id index rather than grouping every item the user owns
+_item_count = (
+    select(func.count(Item.id))
+    .where(Item.collection_id == Collection.id)
+    .correlate(Collection)
+    .scalar_subquery()
+    .label("item_count")
+)
+_total_value = (
+    select(func.sum(Item.estimated_value))
+    .where(Item.collection_id == Collection.id)
+    .correlate(Collection)
+    .scalar_subquery()
+    .label("total_value")
+)
+
+
 async def _get_preview_images(
     collection_ids: list[str],
     session: AsyncSession,
@@ -99,14 +117,8 @@ async def list_collections(
     """List all collections for the current user."""
     # Get collections with item counts and total value
     stmt = (
-        select(
-            Collection,
-            func.count(Item.id).label("item_count"),
-            func.sum(Item.estimated_value).label("total_value"),
-        )
-        .outerjoin(Item, Collection.id == Item.collection_id)
+        select(Collection, _item_count, _total_value)
         .where(Collection.user_id == str(user.id))
-        .group_by(Collection.id)
         .order_by(Collection.name)
     )
     result = await session.execute(stmt)
@@ -139,15 +151,8 @@ async def get_collection(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Get a single collection by ID."""
-    stmt = (
-        select(
-            Collection,
-            func.count(Item.id).label("item_count"),
-            func.sum(Item.estimated_value).label("total_value"),
-        )
-        .outerjoin(Item, Collection.id == Item.collection_id)
-        .where(Collection.id == str(collection_id), Collection.user_id == str(user.id))
-        .group_by(Collection.id)
+    stmt = select(Collection, _item_count, _total_value).where(
+        Collection.id == str(collection_id), Collection.user_id == str(user.id)
     )
     result = await session.execute(stmt)
     row = result.first()
@@ -189,7 +194,6 @@ async def create_collection(
     )
     session.add(collection)
     await session.commit()
-    await session.refresh(collection)
     return collection
 
 
@@ -219,7 +223,6 @@ async def update_collection(
         setattr(collection, field, value)
 
     await session.commit()
-    await session.refresh(collection)
     return collection
 
 
@@ -1,8 +1,10 @@
+from typing import Any
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import and_, delete, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, raiseload
 
 from app.auth import current_active_user
 from app.database import get_async_session
@@ -15,9 +17,19 @@ async def get_user_item(
     session: AsyncSession = Depends(get_async_session),
 ) -> Item:
     """Fetch an item and verify it belongs to the current user."""
-    stmt = select(Item).where(
-        Item.id == str(item_id),
-        Item.user_id == str(user.id),
+    item_key, user_key = str(item_id), str(user.id)
+    # Runs on every nested route; lambda_stmt caches the built statement so only
+    # the two ids are bound per request. Nested routers query their own rows, so any
+    # relationship access on the parent item is a bug and raises instead of lazy loading.
+    stmt = lambda_stmt(
+        lambda: (
+            select(Item)
+            .where(
+                Item.id == item_key,
+                Item.user_id == user_key,
+            )
+            .options(raiseload("*"))
+        )
     )
     result = await session.execute(stmt)
     item = result.scalar_one_or_none()
@@ -29,3 +41,118 @@ async def get_user_item(
         )
 
     return item
+
+
+async def get_user_item_child[T](
+    model: type[T],
+    child_id: UUID,
+    item_id: UUID,
+    user: User,
+    session: AsyncSession,
+    detail: str,
+) -> T:
+    """Fetch a row belonging to an item, verifying the item belongs to the user, in one query.
+
+    Outer-joins from the item so a missing item and a missing child still give distinct 404s.
+    """
+    stmt = (
+        select(Item.id, model)
+        .outerjoin(model, and_(model.item_id == Item.id, model.id == str(child_id)))
+        .where(
+            Item.id == str(item_id),
+            Item.user_id == str(user.id),
+        )
+    )
+    result = await session.execute(stmt)
+    row = result.first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found",
+        )
+    if row[1] is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
+    return row[1]
+
+
+async def update_user_item_child[T](
+    model: type[T],
+    child_id: UUID,
+    item_id: UUID,
+    user: User,
+    session: AsyncSession,
+    detail: str,
+    values: dict[str, Any],
+) -> T:
+    """Update a row belonging to an item owned by the user with one UPDATE ... RETURNING.
+
+    Ownership is checked in the WHERE clause, so a successful update is a single roundtrip.
+    """
+    if not values:
+        return await get_user_item_child(model, child_id, item_id, user, session, detail)
+
+    owned_item = select(Item.id).where(
+        Item.id == str(item_id),
+        Item.user_id == str(user.id),
+    )
+    stmt = (
+        update(model)
+        .where(model.id == str(child_id), model.item_id.in_(owned_item))
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    child = result.scalar_one_or_none()
+
+    if child is None:
+        # Only a miss pays for the lookup that tells a missing item from a missing child
+        await get_user_item_child(model, child_id, item_id, user, session, detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
+    return child
+
+
+async def delete_user_item_child(
+    model: type,
+    child_id: UUID,
+    item_id: UUID,
+    user: User,
+    session: AsyncSession,
+    detail: str,
+    returning: InstrumentedAttribute | None = None,
+) -> Any:
+    """Delete a row belonging to an item owned by the user with one DELETE ... RETURNING.
+
+    Returns the deleted row's ``returning`` column (its id by default).
+    """
+    owned_item = select(Item.id).where(
+        Item.id == str(item_id),
+        Item.user_id == str(user.id),
+    )
+    stmt = (
+        delete(model)
+        .where(model.id == str(child_id), model.item_id.in_(owned_item))
+        .returning(returning if returning is not None else model.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    value = result.scalar_one_or_none()
+
+    if value is None:
+        # Only a miss pays for the lookup that tells a missing item from a missing child
+        await get_user_item_child(model, child_id, item_id, user, session, detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
+    return value
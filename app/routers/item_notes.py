@@ -1,24 +1,36 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import current_active_user
 from app.database import get_async_session
-from app.models import Item
+from app.models import Item, User
 from app.models.item_note import ItemNote
-from app.routers.dependencies import get_user_item
+from app.routers.dependencies import (
+    delete_user_item_child,
+    get_user_item,
+    update_user_item_child,
+)
 from app.schemas.item_note import ItemNoteCreate, ItemNoteRead, ItemNoteUpdate
 
 router = APIRouter(prefix="/items/{item_id}/notes", tags=["notes"])
 
+# Fixed-shape query built once; handlers only bind the item id
+_LIST_NOTES = (
+    select(ItemNote).where(ItemNote.item_id == bindparam("item_id")).order_by(ItemNote.created_at)
+)
+
 
 @router.get("", response_model=list[ItemNoteRead])
 async def list_item_notes(
     item: Item = Depends(get_user_item),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List all notes for an item."""
-    return item.item_notes
+    result = await session.execute(_LIST_NOTES, {"item_id": item.id})
+    return result.scalars().all()
 
 
 @router.post("", response_model=ItemNoteRead, status_code=status.HTTP_201_CREATED)
@@ -30,11 +42,10 @@ async def create_item_note(
     """Create a new note on an item."""
     note = ItemNote(
         item_id=item.id,
-        **data.model_dump(),
+        **data.model_dump(exclude_unset=True),
     )
     session.add(note)
     await session.commit()
-    await session.refresh(note)
     return note
 
 
@@ -42,51 +53,31 @@ async def create_item_note(
 async def update_item_note(
     note_id: UUID,
     data: ItemNoteUpdate,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update a note."""
-    stmt = select(ItemNote).where(
-        ItemNote.id == str(note_id),
-        ItemNote.item_id == item.id,
+    note = await update_user_item_child(
+        ItemNote,
+        note_id,
+        item_id,
+        user,
+        session,
+        detail="Note not found",
+        values=data.model_dump(exclude_unset=True),
     )
-    result = await session.execute(stmt)
-    note = result.scalar_one_or_none()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found",
-        )
-
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(note, field, value)
-
     await session.commit()
-    await session.refresh(note)
     return note
 
 
 @router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item_note(
     note_id: UUID,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete a note."""
-    stmt = select(ItemNote).where(
-        ItemNote.id == str(note_id),
-        ItemNote.item_id == item.id,
-    )
-    result = await session.execute(stmt)
-    note = result.scalar_one_or_none()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found",
-        )
-
-    await session.delete(note)
+    await delete_user_item_child(ItemNote, note_id, item_id, user, session, detail="Note not found")
     await session.commit()
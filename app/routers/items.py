@@ -1,12 +1,15 @@
+import base64
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_, select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.auth import current_active_user
 from app.database import get_async_session
-from app.models import Collection, Item, Tag, User
+from app.models import Collection, Image, Item, Mark, Tag, User
 from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
 from app.storage import delete_files
 from app.type_registry import validate_type_fields
@@ -14,6 +17,40 @@ from app.type_registry import validate_type_fields
 router = APIRouter(prefix="/items", tags=["items"])
 
 
+# Relationships rendered by ItemRead. Item doesn't eager-load them by default, so
+# ownership checks in the nested routers stay a single query.
+_ITEM_DETAIL_OPTIONS = (
+    joinedload(Item.collection),
+    selectinload(Item.tags),
+    selectinload(Item.marks),
+    selectinload(Item.provenance_entries),
+    selectinload(Item.item_notes),
+    selectinload(Item.images),
+)
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_cursor(item: Item) -> str:
+    """Encode an item's position in the list order as an opaque page cursor."""
+    raw = f"{item.created_at.isoformat()}|{item.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a page cursor into the (created_at, id) of the last item seen."""
+    try:
+        created_at, item_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        # Normalise the id so a tampered one is rejected here rather than by the database
+        return datetime.fromisoformat(created_at), str(UUID(item_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+
+
 def _escape_like(value: str) -> str:
     """Escape LIKE wildcard characters so they are matched literally."""
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -23,13 +60,15 @@ async def _resolve_tags(tag_ids: list[UUID], user_id: str, session: AsyncSession
     """Resolve tag UUIDs to Tag objects, verifying user ownership."""
     if not tag_ids:
         return []
+    # Dedupe so repeated ids neither bloat the IN list nor fail the count check below
+    unique_ids = {str(tid) for tid in tag_ids}
     stmt = select(Tag).where(
-        Tag.id.in_([str(tid) for tid in tag_ids]),
+        Tag.id.in_(unique_ids),
         Tag.user_id == user_id,
     )
     result = await session.execute(stmt)
     tags = result.scalars().all()
-    if len(tags) != len(tag_ids):
+    if len(tags) != len(unique_ids):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="One or more tags not found",
@@ -37,18 +76,39 @@ async def _resolve_tags(tag_ids: list[UUID], user_id: str, session: AsyncSession
     return list(tags)
 
 
+async def _load_item_detail(item_id: str, session: AsyncSession) -> Item:
+    """Reload an item with everything ItemRead needs, overwriting stale state."""
+    stmt = (
+        select(Item)
+        .where(Item.id == item_id)
+        .options(*_ITEM_DETAIL_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one()
+
+
 @router.get("", response_model=list[ItemRead])
 async def list_items(
+    response: Response,
     collection_id: UUID | None = Query(default=None, description="Filter by collection"),
     tag: str | None = Query(default=None, description="Filter by tag name"),
     search: str | None = Query(
         default=None, max_length=200, description="Search in name and description"
     ),
+    limit: int = Query(default=50, ge=1, le=200, description="Maximum items to return"),
+    cursor: str | None = Query(
+        default=None, description=f"Resume after a previous page (from {NEXT_CURSOR_HEADER})"
+    ),
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
-    """List all items for the current user with optional filters."""
-    stmt = select(Item).where(Item.user_id == str(user.id))
+    """List items for the current user with optional filters, newest first.
+
+    Pages are keyset-based: when more items remain, the cursor for the next page is
+    returned in the X-Next-Cursor header.
+    """
+    stmt = select(Item).where(Item.user_id == str(user.id)).options(*_ITEM_DETAIL_OPTIONS)
 
     if collection_id is not None:
         stmt = stmt.where(Item.collection_id == str(collection_id))
@@ -66,9 +126,18 @@ async def list_items(
             )
         )
 
-    stmt = stmt.order_by(Item.created_at.desc())
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Item.created_at, Item.id) < _decode_cursor(cursor))
+
+    # Fetch one extra row to learn whether another page follows
+    stmt = stmt.order_by(Item.created_at.desc(), Item.id.desc()).limit(limit + 1)
     result = await session.execute(stmt)
-    return result.unique().scalars().all()
+    items = result.scalars().all()
+
+    if len(items) > limit:
+        items = items[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(items[-1])
+    return items
 
 
 @router.get("/{item_id}", response_model=ItemRead)
@@ -78,9 +147,13 @@ async def get_item(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Get a single item by ID."""
-    stmt = select(Item).where(
-        Item.id == str(item_id),
-        Item.user_id == str(user.id),
+    stmt = (
+        select(Item)
+        .where(
+            Item.id == str(item_id),
+            Item.user_id == str(user.id),
+        )
+        .options(*_ITEM_DETAIL_OPTIONS)
     )
     result = await session.execute(stmt)
     item = result.scalar_one_or_none()
@@ -101,23 +174,25 @@ async def create_item(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Create a new item."""
-    # Verify collection belongs to user if provided
-    collection = None
+    user_id = str(user.id)
+
+    # Verify collection belongs to user if provided (only its type is needed)
+    collection_type = None
     if data.collection_id is not None:
-        stmt = select(Collection).where(
+        stmt = select(Collection.type).where(
             Collection.id == str(data.collection_id),
-            Collection.user_id == str(user.id),
+            Collection.user_id == user_id,
         )
         result = await session.execute(stmt)
-        collection = result.scalar_one_or_none()
-        if not collection:
+        collection_type = result.scalar_one_or_none()
+        if collection_type is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Collection not found",
             )
 
     # Resolve tags
-    tags = await _resolve_tags(data.tag_ids, str(user.id), session)
+    tags = await _resolve_tags(data.tag_ids, user_id, session)
 
     item_data = data.model_dump(exclude={"tag_ids"})
     if item_data.get("collection_id"):
@@ -126,20 +201,19 @@ async def create_item(
         item_data["condition"] = item_data["condition"].value
 
     # Validate type_fields against the collection's type
-    if item_data.get("type_fields") and collection:
-        item_data["type_fields"] = validate_type_fields(collection.type, item_data["type_fields"])
-    elif item_data.get("type_fields") and not collection:
+    if item_data.get("type_fields") and collection_type is not None:
+        item_data["type_fields"] = validate_type_fields(collection_type, item_data["type_fields"])
+    elif item_data.get("type_fields") and collection_type is None:
         item_data["type_fields"] = None
 
     item = Item(
-        user_id=str(user.id),
+        user_id=user_id,
         **item_data,
     )
     item.tags = tags
     session.add(item)
     await session.commit()
-    await session.refresh(item)
-    return item
+    return await _load_item_detail(item.id, session)
 
 
 @router.patch("/{item_id}", response_model=ItemRead)
@@ -150,10 +224,18 @@ async def update_item(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update an item."""
+    user_id = str(user.id)
+
+    update_data = data.model_dump(exclude_unset=True)
+
+    # The response is reloaded with full detail after commit, so only load what's
+    # needed to apply the update: tags when they're being replaced
     stmt = select(Item).where(
         Item.id == str(item_id),
-        Item.user_id == str(user.id),
+        Item.user_id == user_id,
     )
+    if "tag_ids" in update_data:
+        stmt = stmt.options(selectinload(Item.tags))
     result = await session.execute(stmt)
     item = result.scalar_one_or_none()
 
@@ -163,24 +245,24 @@ async def update_item(
             detail="Item not found",
         )
 
-    update_data = data.model_dump(exclude_unset=True)
-
     # Handle tags separately
     if "tag_ids" in update_data:
         tag_ids = update_data.pop("tag_ids")
         if tag_ids is not None:
-            item.tags = await _resolve_tags(tag_ids, str(user.id), session)
+            item.tags = await _resolve_tags(tag_ids, user_id, session)
         else:
             item.tags = []
 
-    # Verify collection belongs to user if being updated
+    # Verify collection belongs to user if being updated (only its type is needed)
+    new_collection_type = None
     if "collection_id" in update_data and update_data["collection_id"] is not None:
-        stmt = select(Collection).where(
+        stmt = select(Collection.type).where(
             Collection.id == str(update_data["collection_id"]),
-            Collection.user_id == str(user.id),
+            Collection.user_id == user_id,
         )
         result = await session.execute(stmt)
-        if not result.scalar_one_or_none():
+        new_collection_type = result.scalar_one_or_none()
+        if new_collection_type is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Collection not found",
@@ -191,18 +273,21 @@ async def update_item(
     if "condition" in update_data and update_data["condition"] is not None:
         update_data["condition"] = update_data["condition"].value
 
-    # Validate type_fields against the item's collection type
+    # Validate type_fields against the type of the collection the item ends up in
     if "type_fields" in update_data and update_data["type_fields"] is not None:
-        if item.collection_id:
-            stmt = select(Collection).where(Collection.id == item.collection_id)
+        if "collection_id" in update_data:
+            collection_type = new_collection_type
+        elif item.collection_id:
+            stmt = select(Collection.type).where(Collection.id == item.collection_id)
             result = await session.execute(stmt)
-            collection = result.scalar_one_or_none()
-            if collection:
-                update_data["type_fields"] = validate_type_fields(
-                    collection.type, update_data["type_fields"]
-                )
-            else:
-                update_data["type_fields"] = None
+            collection_type = result.scalar_one_or_none()
+        else:
+            collection_type = None
+
+        if collection_type is not None:
+            update_data["type_fields"] = validate_type_fields(
+                collection_type, update_data["type_fields"]
+            )
         else:
             update_data["type_fields"] = None
 
@@ -210,35 +295,40 @@ async def update_item(
         setattr(item, field, value)
 
     await session.commit()
-    await session.refresh(item)
-    return item
+    return await _load_item_detail(item.id, session)
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(
     item_id: UUID,
+    background_tasks: BackgroundTasks,
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete an item."""
-    stmt = select(Item).where(
+    stmt = select(Item.id).where(
         Item.id == str(item_id),
         Item.user_id == str(user.id),
     )
-    result = await session.execute(stmt)
-    item = result.scalar_one_or_none()
-
-    if not item:
+    if (await session.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Item not found",
         )
 
-    # Collect storage keys before deletion for best-effort R2 cleanup
-    storage_keys = [img.storage_key for img in item.images]
+    # Delete the item's images and its marks' images in one statement, keeping
+    # the storage keys for best-effort R2 cleanup
+    mark_ids = select(Mark.id).where(Mark.item_id == str(item_id))
+    stmt = (
+        delete(Image)
+        .where(or_(Image.item_id == str(item_id), Image.mark_id.in_(mark_ids)))
+        .returning(Image.storage_key)
+    )
+    storage_keys = list((await session.execute(stmt)).scalars())
 
-    await session.delete(item)
+    # Marks, provenance entries, notes and tag links go via ON DELETE CASCADE
+    await session.execute(delete(Item).where(Item.id == str(item_id)))
     await session.commit()
 
-    # Best-effort R2 cleanup
-    await delete_files(storage_keys)
+    # Best-effort R2 cleanup, run after the response is sent
+    background_tasks.add_task(delete_files, storage_keys)
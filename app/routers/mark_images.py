@@ -1,15 +1,16 @@
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, status
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import current_active_user
 from app.database import get_async_session
-from app.image_utils import MAX_MARK_IMAGES, validate_image_file
-from app.models import Item, User
+from app.image_utils import MAX_MARK_IMAGES, extension_from_content_type, validate_image_file
+from app.models import User
 from app.models.image import Image
 from app.models.mark import Mark
+from app.routers.dependencies import get_user_item_child
 from app.schemas.image import ImageRead
 from app.storage import delete_file, upload_file
 
@@ -23,33 +24,7 @@ async def _get_user_mark(
     session: AsyncSession = Depends(get_async_session),
 ) -> Mark:
     """Fetch a mark and verify the parent item belongs to the current user."""
-    stmt = select(Item).where(
-        Item.id == str(item_id),
-        Item.user_id == str(user.id),
-    )
-    result = await session.execute(stmt)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found",
-        )
-
-    stmt = select(Mark).where(
-        Mark.id == str(mark_id),
-        Mark.item_id == item.id,
-    )
-    result = await session.execute(stmt)
-    mark = result.scalar_one_or_none()
-
-    if not mark:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Mark not found",
-        )
-
-    return mark
+    return await get_user_item_child(Mark, mark_id, item_id, user, session, detail="Mark not found")
 
 
 @router.get("", response_model=list[ImageRead])
@@ -64,86 +39,78 @@ async def list_mark_images(
 async def upload_mark_image(
     file: UploadFile,
     mark: Mark = Depends(_get_user_mark),
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Upload an image for a mark."""
     # Validate file
-    data = await validate_image_file(file)
+    size = await validate_image_file(file)
 
-    # Check image count limit
-    stmt = select(Image).where(Image.mark_id == mark.id)
+    # Check image count limit (aggregate only; the existing rows aren't needed)
+    stmt = select(func.count(), func.max(Image.position)).where(Image.mark_id == mark.id)
     result = await session.execute(stmt)
-    existing = result.scalars().all()
-    if len(existing) >= MAX_MARK_IMAGES:
+    image_count, max_position = result.one()
+    if image_count >= MAX_MARK_IMAGES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Maximum of {MAX_MARK_IMAGES} images per mark",
         )
 
     # Determine position (append to end)
-    position = max((img.position for img in existing), default=-1) + 1
+    position = 0 if max_position is None else max_position + 1
 
     # Upload to R2
     image_id = str(uuid4())
-    ext = _extension_from_content_type(file.content_type)
+    ext = extension_from_content_type(file.content_type)
     storage_key = f"marks/{mark.id}/{image_id}{ext}"
 
-    # Get user_id from the parent item
-    stmt = select(Item.user_id).where(Item.id == mark.item_id)
-    result = await session.execute(stmt)
-    user_id = result.scalar_one()
-
-    url = await upload_file(data, storage_key, file.content_type)
+    url = await upload_file(file.file, storage_key, file.content_type)
 
     # Create DB record
     image = Image(
         id=image_id,
-        user_id=user_id,
+        # _get_user_mark verified the parent item belongs to this user
+        user_id=str(user.id),
         mark_id=mark.id,
         filename=file.filename or f"image{ext}",
         storage_key=storage_key,
         url=url,
         content_type=file.content_type,
-        size_bytes=len(data),
+        size_bytes=size,
         position=position,
     )
     session.add(image)
     await session.commit()
-    await session.refresh(image)
     return image
 
 
 @router.delete("/{image_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mark_image(
     image_id: UUID,
+    background_tasks: BackgroundTasks,
     mark: Mark = Depends(_get_user_mark),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete an image from a mark."""
-    stmt = select(Image).where(
-        Image.id == str(image_id),
-        Image.mark_id == mark.id,
+    stmt = (
+        delete(Image)
+        .where(
+            Image.id == str(image_id),
+            Image.mark_id == mark.id,
+        )
+        .returning(Image.storage_key)
+        .execution_options(synchronize_session=False)
     )
     result = await session.execute(stmt)
-    image = result.scalar_one_or_none()
+    storage_key = result.scalar_one_or_none()
 
-    if not image:
+    if storage_key is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image not found",
         )
 
-    storage_key = image.storage_key
-    await session.delete(image)
     await session.commit()
 
-    # Best-effort R2 cleanup
-    await delete_file(storage_key)
-
-
-def _extension_from_content_type(content_type: str | None) -> str:
-    return {
-        "image/jpeg": ".jpg",
-        "image/png": ".png",
-        "image/webp": ".webp",
-    }.get(content_type or "", ".bin")
+    # Best-effort R2 cleanup, run after the response is sent
+    background_tasks.add_task(delete_file, storage_key)
@@ -1,25 +1,36 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, status
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import current_active_user
 from app.database import get_async_session
-from app.models import Item
+from app.models import Item, User
+from app.models.image import Image
 from app.models.mark import Mark
-from app.routers.dependencies import get_user_item
+from app.routers.dependencies import (
+    delete_user_item_child,
+    get_user_item,
+    update_user_item_child,
+)
 from app.schemas.mark import MarkCreate, MarkRead, MarkUpdate
 from app.storage import delete_files
 
 router = APIRouter(prefix="/items/{item_id}/marks", tags=["marks"])
 
+# Fixed-shape query built once; handlers only bind the item id
+_LIST_MARKS = select(Mark).where(Mark.item_id == bindparam("item_id")).order_by(Mark.created_at)
+
 
 @router.get("", response_model=list[MarkRead])
 async def list_marks(
     item: Item = Depends(get_user_item),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List all marks for an item."""
-    return item.marks
+    result = await session.execute(_LIST_MARKS, {"item_id": item.id})
+    return result.scalars().all()
 
 
 @router.post("", response_model=MarkRead, status_code=status.HTTP_201_CREATED)
@@ -29,13 +40,14 @@ async def create_mark(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Create a new mark on an item."""
+    # A new mark has no images; setting it avoids a lazy load when serializing
     mark = Mark(
         item_id=item.id,
-        **data.model_dump(),
+        images=[],
+        **data.model_dump(exclude_unset=True),
     )
     session.add(mark)
     await session.commit()
-    await session.refresh(mark)
     return mark
 
 
@@ -43,57 +55,40 @@ async def create_mark(
 async def update_mark(
     mark_id: UUID,
     data: MarkUpdate,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update a mark."""
-    stmt = select(Mark).where(
-        Mark.id == str(mark_id),
-        Mark.item_id == item.id,
+    mark = await update_user_item_child(
+        Mark,
+        mark_id,
+        item_id,
+        user,
+        session,
+        detail="Mark not found",
+        values=data.model_dump(exclude_unset=True),
     )
-    result = await session.execute(stmt)
-    mark = result.scalar_one_or_none()
-
-    if not mark:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Mark not found",
-        )
-
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(mark, field, value)
-
     await session.commit()
-    await session.refresh(mark)
     return mark
 
 
 @router.delete("/{mark_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mark(
     mark_id: UUID,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete a mark."""
-    stmt = select(Mark).where(
-        Mark.id == str(mark_id),
-        Mark.item_id == item.id,
-    )
-    result = await session.execute(stmt)
-    mark = result.scalar_one_or_none()
-
-    if not mark:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Mark not found",
-        )
-
-    # Collect storage keys before deletion for best-effort R2 cleanup
-    storage_keys = [img.storage_key for img in mark.images]
+    # Collect storage keys first: the mark's images go with it via ON DELETE CASCADE.
+    # They are only used once the ownership-checked delete below succeeds.
+    stmt = select(Image.storage_key).where(Image.mark_id == str(mark_id))
+    storage_keys = list((await session.execute(stmt)).scalars())
 
-    await session.delete(mark)
+    await delete_user_item_child(Mark, mark_id, item_id, user, session, detail="Mark not found")
     await session.commit()
 
-    # Best-effort R2 cleanup
-    await delete_files(storage_keys)
+    # Best-effort R2 cleanup, run after the response is sent
+    background_tasks.add_task(delete_files, storage_keys)
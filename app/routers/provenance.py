@@ -1,13 +1,18 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import current_active_user
 from app.database import get_async_session
-from app.models import Item
+from app.models import Item, User
 from app.models.provenance_entry import ProvenanceEntry
-from app.routers.dependencies import get_user_item
+from app.routers.dependencies import (
+    delete_user_item_child,
+    get_user_item,
+    update_user_item_child,
+)
 from app.schemas.provenance_entry import (
     ProvenanceEntryCreate,
     ProvenanceEntryRead,
@@ -16,13 +21,22 @@ from app.schemas.provenance_entry import (
 
 router = APIRouter(prefix="/items/{item_id}/provenance", tags=["provenance"])
 
+# Fixed-shape query built once; handlers only bind the item id
+_LIST_ENTRIES = (
+    select(ProvenanceEntry)
+    .where(ProvenanceEntry.item_id == bindparam("item_id"))
+    .order_by(ProvenanceEntry.created_at)
+)
+
 
 @router.get("", response_model=list[ProvenanceEntryRead])
 async def list_provenance_entries(
     item: Item = Depends(get_user_item),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List all provenance entries for an item."""
-    return item.provenance_entries
+    result = await session.execute(_LIST_ENTRIES, {"item_id": item.id})
+    return result.scalars().all()
 
 
 @router.post("", response_model=ProvenanceEntryRead, status_code=status.HTTP_201_CREATED)
@@ -34,11 +48,10 @@ async def create_provenance_entry(
     """Create a new provenance entry on an item."""
     entry = ProvenanceEntry(
         item_id=item.id,
-        **data.model_dump(),
+        **data.model_dump(exclude_unset=True),
     )
     session.add(entry)
     await session.commit()
-    await session.refresh(entry)
     return entry
 
 
@@ -46,51 +59,33 @@ async def create_provenance_entry(
 async def update_provenance_entry(
     entry_id: UUID,
     data: ProvenanceEntryUpdate,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update a provenance entry."""
-    stmt = select(ProvenanceEntry).where(
-        ProvenanceEntry.id == str(entry_id),
-        ProvenanceEntry.item_id == item.id,
+    entry = await update_user_item_child(
+        ProvenanceEntry,
+        entry_id,
+        item_id,
+        user,
+        session,
+        detail="Provenance entry not found",
+        values=data.model_dump(exclude_unset=True),
     )
-    result = await session.execute(stmt)
-    entry = result.scalar_one_or_none()
-
-    if not entry:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Provenance entry not found",
-        )
-
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(entry, field, value)
-
     await session.commit()
-    await session.refresh(entry)
     return entry
 
 
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_provenance_entry(
     entry_id: UUID,
-    item: Item = Depends(get_user_item),
+    item_id: UUID,
+    user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete a provenance entry."""
-    stmt = select(ProvenanceEntry).where(
-        ProvenanceEntry.id == str(entry_id),
-        ProvenanceEntry.item_id == item.id,
+    await delete_user_item_child(
+        ProvenanceEntry, entry_id, item_id, user, session, detail="Provenance entry not found"
     )
-    result = await session.execute(stmt)
-    entry = result.scalar_one_or_none()
-
-    if not entry:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Provenance entry not found",
-        )
-
-    await session.delete(entry)
     await session.commit()
@@ -1,8 +1,10 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.auth import current_active_user
 from app.database import get_async_session
@@ -11,6 +13,9 @@ from app.schemas.tag import TagCreate, TagRead, TagUpdate
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
+# Fixed-shape query built once; handlers only bind the user id
+_LIST_TAGS = select(Tag).where(Tag.user_id == bindparam("user_id")).order_by(Tag.name)
+
 
 @router.get("", response_model=list[TagRead])
 async def list_tags(
@@ -18,8 +23,7 @@ async def list_tags(
     session: AsyncSession = Depends(get_async_session),
 ):
     """List all tags for the current user, sorted alphabetically."""
-    stmt = select(Tag).where(Tag.user_id == str(user.id)).order_by(Tag.name)
-    result = await session.execute(stmt)
+    result = await session.execute(_LIST_TAGS, {"user_id": str(user.id)})
     return result.scalars().all()
 
 
@@ -30,18 +34,23 @@ async def create_tag(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Create a new tag. Returns 409 if a tag with the same name already exists."""
-    stmt = select(Tag).where(Tag.user_id == str(user.id), Tag.name == data.name)
+    # The (user_id, name) unique constraint does the duplicate check in the same statement
+    stmt = (
+        insert(Tag)
+        .values(user_id=str(user.id), name=data.name)
+        .on_conflict_do_nothing(index_elements=["user_id", "name"])
+        .returning(Tag)
+    )
     result = await session.execute(stmt)
-    if result.scalar_one_or_none():
+    tag = result.scalar_one_or_none()
+
+    if not tag:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Tag with this name already exists",
         )
 
-    tag = Tag(user_id=str(user.id), name=data.name)
-    session.add(tag)
     await session.commit()
-    await session.refresh(tag)
     return tag
 
 
@@ -53,32 +62,44 @@ async def update_tag(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Rename a tag."""
-    stmt = select(Tag).where(Tag.id == str(tag_id), Tag.user_id == str(user.id))
+    tag_key, user_id = str(tag_id), str(user.id)
+
+    # Rename in one UPDATE ... RETURNING, guarded against taking another tag's name
+    other = aliased(Tag)
+    name_taken = (
+        select(other.id)
+        .where(
+            other.user_id == user_id,
+            other.name == data.name,
+            other.id != tag_key,
+        )
+        .exists()
+    )
+    stmt = (
+        update(Tag)
+        .where(Tag.id == tag_key, Tag.user_id == user_id, ~name_taken)
+        .values(name=data.name)
+        .returning(Tag)
+        .execution_options(synchronize_session=False)
+    )
     result = await session.execute(stmt)
     tag = result.scalar_one_or_none()
 
     if not tag:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tag not found",
-        )
-
-    # Check for duplicate name
-    stmt = select(Tag).where(
-        Tag.user_id == str(user.id),
-        Tag.name == data.name,
-        Tag.id != str(tag_id),
-    )
-    result = await session.execute(stmt)
-    if result.scalar_one_or_none():
+        # Only a miss pays for the lookup that tells a missing tag from a duplicate name
+        stmt = select(Tag.id).where(Tag.id == tag_key, Tag.user_id == user_id)
+        result = await session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tag not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Tag with this name already exists",
         )
 
-    tag.name = data.name
     await session.commit()
-    await session.refresh(tag)
     return tag
 
 
@@ -89,15 +110,18 @@ async def delete_tag(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Delete a tag. Removes it from all items automatically."""
-    stmt = select(Tag).where(Tag.id == str(tag_id), Tag.user_id == str(user.id))
+    stmt = (
+        delete(Tag)
+        .where(Tag.id == str(tag_id), Tag.user_id == str(user.id))
+        .returning(Tag.id)
+        .execution_options(synchronize_session=False)
+    )
     result = await session.execute(stmt)
-    tag = result.scalar_one_or_none()
 
-    if not tag:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found",
         )
 
-    await session.delete(tag)
     await session.commit()
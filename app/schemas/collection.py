@@ -1,25 +1,22 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.type_registry import COLLECTION_TYPES
 
+# The registry is static, so its names can be a Literal validated by pydantic-core
+CollectionType = Literal[tuple(COLLECTION_TYPES)]
+
 
 class CollectionBase(BaseModel):
     """Base schema for Collection."""
 
     name: str = Field(..., max_length=200)
     description: str | None = Field(default=None, max_length=2000)
-    type: str = Field(default="general", max_length=50)
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        if v not in COLLECTION_TYPES:
-            raise ValueError(f"Unknown collection type: {v}")
-        return v
+    type: CollectionType = "general"
 
 
 class CollectionCreate(CollectionBase):
@@ -33,14 +30,7 @@ class CollectionUpdate(BaseModel):
 
     name: str | None = Field(default=None, max_length=200)
     description: str | None = Field(default=None, max_length=2000)
-    type: str | None = Field(default=None, max_length=50)
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str | None) -> str | None:
-        if v is not None and v not in COLLECTION_TYPES:
-            raise ValueError(f"Unknown collection type: {v}")
-        return v
+    type: CollectionType | None = None
 
 
 class CollectionRead(CollectionBase):
@@ -1,6 +1,10 @@
+import asyncio
 import logging
+from contextlib import AsyncExitStack
+from typing import Any, BinaryIO
 
 import aioboto3
+from aiobotocore.config import AioConfig
 
 from app.config import settings
 
@@ -8,54 +12,110 @@ logger = logging.getLogger(__name__)
 
 _session = aioboto3.Session()
 
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+# Bounds concurrent DeleteObjects requests so large purges don't trip R2 rate limits
+_delete_semaphore = asyncio.Semaphore(8)
+
 
 def _get_endpoint_url() -> str:
     return f"https://{settings.r2_account_id}.r2.cloudflarestorage.com"
 
 
-def _get_client():
-    return _session.client(
-        "s3",
-        endpoint_url=_get_endpoint_url(),
-        aws_access_key_id=settings.r2_access_key_id,
-        aws_secret_access_key=settings.r2_secret_access_key,
-        region_name="auto",
-    )
+# Adaptive retries back off client-side when R2 answers 429/503, rather than retrying
+# straight into throttling; the pool is sized for concurrent uploads and delete batches.
+_client_config = AioConfig(
+    max_pool_connections=32,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
 
+# One client per process, created on first use: reuses its endpoint setup, credentials
+# and pooled keep-alive connections instead of paying for them on every call.
+_client: Any = None
+_client_stack: AsyncExitStack | None = None
+_client_lock = asyncio.Lock()
 
-async def upload_file(data: bytes, key: str, content_type: str) -> str:
-    """Upload a file to R2 and return its public URL."""
-    async with _get_client() as client:
-        await client.put_object(
-            Bucket=settings.r2_bucket_name,
-            Key=key,
-            Body=data,
-            ContentType=content_type,
-        )
+
+async def _get_client() -> Any:
+    """Return the shared S3 client for R2, creating it on first use."""
+    global _client, _client_stack
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                stack = AsyncExitStack()
+                _client = await stack.enter_async_context(
+                    _session.client(
+                        "s3",
+                        endpoint_url=_get_endpoint_url(),
+                        aws_access_key_id=settings.r2_access_key_id,
+                        aws_secret_access_key=settings.r2_secret_access_key,
+                        region_name="auto",
+                        config=_client_config,
+                    )
+                )
+                _client_stack = stack
+    return _client
+
+
+async def close_storage_client() -> None:
+    """Close the shared S3 client (called on app shutdown)."""
+    global _client, _client_stack
+    if _client_stack is not None:
+        await _client_stack.aclose()
+    _client = _client_stack = None
+
+
+async def upload_file(data: bytes | BinaryIO, key: str, content_type: str) -> str:
+    """Upload a file (bytes or a seekable file object) to R2 and return its public URL."""
+    client = await _get_client()
+    await client.put_object(
+        Bucket=settings.r2_bucket_name,
+        Key=key,
+        Body=data,
+        ContentType=content_type,
+    )
     return f"{settings.r2_public_url}/{key}"
 
 
 async def delete_file(key: str) -> None:
     """Delete a single file from R2. Errors are logged but not raised."""
     try:
-        async with _get_client() as client:
-            await client.delete_object(
-                Bucket=settings.r2_bucket_name,
-                Key=key,
-            )
+        client = await _get_client()
+        await client.delete_object(
+            Bucket=settings.r2_bucket_name,
+            Key=key,
+        )
     except Exception:
         logger.exception("Failed to delete file from R2: %s", key)
 
 
-async def delete_files(keys: list[str]) -> None:
-    """Delete multiple files from R2. Errors are logged but not raised."""
-    if not keys:
-        return
-    try:
-        async with _get_client() as client:
+async def _delete_batch(batch: list[str]) -> None:
+    """Delete up to 1000 files from R2 in one DeleteObjects request."""
+    async with _delete_semaphore:
+        try:
+            client = await _get_client()
             await client.delete_objects(
                 Bucket=settings.r2_bucket_name,
-                Delete={"Objects": [{"Key": k} for k in keys]},
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
             )
-    except Exception:
-        logger.exception("Failed to delete files from R2: %s", keys)
+        except Exception:
+            logger.exception("Failed to delete files from R2: %s", batch)
+
+
+async def delete_files(keys: list[str]) -> None:
+    """Delete multiple files from R2. Errors are logged but not raised.
+
+    Keys are sent in DeleteObjects batches of up to 1000, a few batches at a time, and a
+    failed batch doesn't stop the others.
+    """
+    if not keys:
+        return
+    await asyncio.gather(
+        *(
+            _delete_batch(keys[start : start + _DELETE_BATCH_SIZE])
+            for start in range(0, len(keys), _DELETE_BATCH_SIZE)
+        )
+    )
@@ -85,17 +85,23 @@ COLLECTION_TYPES: dict = {
 }
 
 
-def get_type_field_names(collection_type: str) -> set[str]:
+# Built once so validating an item's type_fields doesn't rebuild the set per request
+_TYPE_FIELD_NAMES: dict[str, frozenset[str]] = {
+    name: frozenset(f["name"] for f in definition["fields"])
+    for name, definition in COLLECTION_TYPES.items()
+}
+
+
+def get_type_field_names(collection_type: str) -> frozenset[str]:
     """Return the set of valid field names for a collection type."""
-    type_def = COLLECTION_TYPES.get(collection_type)
-    if not type_def:
-        return set()
-    return {f["name"] for f in type_def["fields"]}
+    return _TYPE_FIELD_NAMES.get(collection_type, frozenset())
 
 
 def validate_type_fields(collection_type: str, type_fields: dict) -> dict:
     """Strip unknown fields and return only valid ones."""
-    valid = get_type_field_names(collection_type)
+    valid = _TYPE_FIELD_NAMES.get(collection_type)
+    if not valid:
+        return {}
     return {k: v for k, v in type_fields.items() if k in valid}
 
 
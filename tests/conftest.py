@@ -3,9 +3,11 @@ from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.auth import current_active_user
+from app.auth.rate_limit import storage as rate_limit_storage
 from app.database import Base, get_async_session
 from app.main import app
 from app.models import User
@@ -14,6 +16,16 @@ from app.models import User
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def enable_foreign_keys(dbapi_connection, connection_record):
+    """SQLite leaves foreign keys off by default, so ON DELETE CASCADE would never fire."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -27,6 +39,13 @@ async def setup_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(autouse=True)
+async def reset_rate_limits():
+    """Clear in-memory rate limit counters between tests."""
+    await rate_limit_storage.reset()
+    yield
+
+
 async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
@@ -56,7 +75,7 @@ async def session() -> AsyncGenerator[AsyncSession, None]:
 async def test_user(session: AsyncSession) -> User:
     """Create a test user."""
     user = User(
-        id=str(uuid4()),
+        id=uuid4(),
         email="test@example.com",
         hashed_password="fakehash",
         is_active=True,
@@ -73,7 +92,7 @@ async def test_user(session: AsyncSession) -> User:
 async def other_user(session: AsyncSession) -> User:
     """Create another test user for ownership tests."""
     user = User(
-        id=str(uuid4()),
+        id=uuid4(),
         email="other@example.com",
         hashed_password="fakehash",
         is_active=True,
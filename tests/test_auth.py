@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+from fastapi_users.password import PasswordHelper
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+
+
+@pytest.fixture
+async def password_user(session: AsyncSession) -> User:
+    """Create a user with a real password hash."""
+    user = User(
+        id=uuid4(),
+        email="login@example.com",
+        hashed_password=PasswordHelper().hash("correct-horse-battery"),
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_login(client: AsyncClient, password_user: User):
+    """Test logging in sets access and refresh cookies."""
+    response = await client.post(
+        "/auth/jwt/login",
+        data={"username": "login@example.com", "password": "correct-horse-battery"},
+    )
+    assert response.status_code == 204
+    cookies = response.headers.get_list("set-cookie")
+    assert any(c.startswith("trove_access=") for c in cookies)
+    assert any(c.startswith("trove_refresh=") for c in cookies)
+
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(client: AsyncClient, password_user: User):
+    """Test logging in with a wrong password fails."""
+    response = await client.post(
+        "/auth/jwt/login",
+        data={"username": "login@example.com", "password": "wrong-password"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_login_unknown_user(client: AsyncClient):
+    """Test logging in as an unknown user fails."""
+    response = await client.post(
+        "/auth/jwt/login",
+        data={"username": "nobody@example.com", "password": "whatever"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_auth_rate_limit(client: AsyncClient):
+    """Test register is limited to 3 requests per minute."""
+    for _ in range(3):
+        response = await client.post("/auth/register", json={})
+        assert response.status_code == 422
+
+    for _ in range(2):
+        response = await client.post("/auth/register", json={})
+        assert response.status_code == 429
+        assert response.json() == {"detail": "Rate limit exceeded"}
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_ignores_other_methods(client: AsyncClient):
+    """Test the auth rate limit only applies to the limited method."""
+    for _ in range(5):
+        response = await client.get("/auth/register")
+        assert response.status_code == 405
@@ -1,3 +1,6 @@
+import base64
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -193,6 +196,45 @@ async def test_list_items(client: AsyncClient, session: AsyncSession, test_user:
     assert len(data) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_items_paginated(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client
+):
+    """Test keyset pagination walks every item once, newest first."""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    # Two items share a timestamp so the id tiebreak is exercised across a page boundary
+    offsets = [0, 1, 1, 2, 3]
+    session.add_all(
+        Item(user_id=str(test_user.id), name=f"Item {i}", created_at=base + timedelta(hours=h))
+        for i, h in enumerate(offsets)
+    )
+    await session.commit()
+
+    names: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await client.get("/items", params=params)
+        assert response.status_code == 200
+        names += [item["name"] for item in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+    assert cursor is None
+    assert len(names) == len(set(names)) == 5
+    assert names[:2] == ["Item 4", "Item 3"]
+    assert names[-1] == "Item 0"
+
+
+@pytest.mark.asyncio
+async def test_list_items_invalid_cursor(client: AsyncClient, test_user: User, auth_client):
+    """Test a malformed cursor is rejected."""
+    response = await client.get("/items", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    cursor = base64.urlsafe_b64encode(b"2026-01-01T00:00:00|x").decode()
+    response = await client.get("/items", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_list_items_filter_by_collection(
     client: AsyncClient, session: AsyncSession, test_user: User, auth_client
@@ -344,6 +386,20 @@ async def test_update_item_tags(
     assert data["tags"][0]["name"] == "Vintage"
 
 
+@pytest.mark.asyncio
+async def test_create_item_with_duplicate_tag_ids(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client
+):
+    """Test repeated tag ids are attached once instead of failing validation."""
+    tag = Tag(user_id=str(test_user.id), name="Art")
+    session.add(tag)
+    await session.commit()
+
+    response = await client.post("/items", json={"name": "Item", "tag_ids": [tag.id, tag.id]})
+    assert response.status_code == 201
+    assert [t["name"] for t in response.json()["tags"]] == ["Art"]
+
+
 @pytest.mark.asyncio
 async def test_update_item_clear_tags(
     client: AsyncClient, session: AsyncSession, test_user: User, auth_client
@@ -563,6 +619,24 @@ async def test_update_item_type_fields(
     assert data["type_fields"]["color"] == "Red"
 
 
+@pytest.mark.asyncio
+async def test_update_item_type_fields_when_moving_collection(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client
+):
+    """Test type_fields are validated against the collection the item is moved into."""
+    collection = Collection(user_id=str(test_user.id), name="Stamps", type="stamp")
+    item = Item(user_id=str(test_user.id), name="Stamp")
+    session.add_all([collection, item])
+    await session.commit()
+
+    response = await client.patch(
+        f"/items/{item.id}",
+        json={"collection_id": collection.id, "type_fields": {"color": "Red", "bogus": 1}},
+    )
+    assert response.status_code == 200
+    assert response.json()["type_fields"] == {"color": "Red"}
+
+
 @pytest.mark.asyncio
 async def test_items_isolation(
     client: AsyncClient, session: AsyncSession, test_user: User, other_user: User, auth_client
@@ -3,9 +3,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Item, User
+from app.models import Item, ItemNote, ProvenanceEntry, Tag, User, item_tags
 from app.models.image import Image
 from app.models.mark import Mark
 
@@ -223,3 +224,110 @@ async def test_mark_images_in_mark_response(
     assert len(marks) == 1
     assert len(marks[0]["images"]) == 1
     assert marks[0]["images"][0]["filename"] == "test.jpg"
+
+
+@pytest.mark.asyncio
+async def test_delete_mark_removes_its_images(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client, item_and_mark
+):
+    """Test deleting a mark removes its images and cleans up their files."""
+    item, mark = item_and_mark
+    session.add(
+        Image(
+            user_id=str(test_user.id),
+            mark_id=mark.id,
+            filename="test.jpg",
+            storage_key=f"marks/{mark.id}/test.jpg",
+            url="https://r2.example.com/test.jpg",
+            content_type="image/jpeg",
+            size_bytes=100,
+            position=0,
+        )
+    )
+    await session.commit()
+
+    with patch("app.routers.marks.delete_files", new_callable=AsyncMock) as mock_delete:
+        response = await client.delete(f"/items/{item.id}/marks/{mark.id}")
+    assert response.status_code == 204
+    mock_delete.assert_awaited_once_with([f"marks/{mark.id}/test.jpg"])
+
+    result = await session.execute(select(func.count()).select_from(Image))
+    assert result.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_item_cleans_up_all_images(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client, item_and_mark
+):
+    """Test deleting an item removes its children and images and cleans up their files."""
+    item, mark = item_and_mark
+    tag = Tag(user_id=str(test_user.id), name="Art")
+    session.add_all(
+        [
+            tag,
+            ProvenanceEntry(item_id=item.id, owner_name="Previous Owner"),
+            ItemNote(item_id=item.id, body="Note"),
+        ]
+    )
+    await session.flush()
+    await session.execute(item_tags.insert().values(item_id=item.id, tag_id=tag.id))
+    image_fields = {
+        "user_id": str(test_user.id),
+        "filename": "test.jpg",
+        "url": "https://r2.example.com/test.jpg",
+        "content_type": "image/jpeg",
+        "size_bytes": 100,
+        "position": 0,
+    }
+    session.add_all(
+        [
+            Image(item_id=item.id, storage_key=f"items/{item.id}/test.jpg", **image_fields),
+            Image(mark_id=mark.id, storage_key=f"marks/{mark.id}/test.jpg", **image_fields),
+        ]
+    )
+    await session.commit()
+
+    with patch("app.routers.items.delete_files", new_callable=AsyncMock) as mock_delete:
+        response = await client.delete(f"/items/{item.id}")
+    assert response.status_code == 204
+    mock_delete.assert_awaited_once()
+    assert sorted(mock_delete.await_args.args[0]) == sorted(
+        [f"items/{item.id}/test.jpg", f"marks/{mark.id}/test.jpg"]
+    )
+
+    result = await session.execute(select(func.count()).select_from(Image))
+    assert result.scalar_one() == 0
+    for model in (Mark, ProvenanceEntry, ItemNote):
+        stmt = select(func.count()).select_from(model).where(model.item_id == item.id)
+        assert (await session.execute(stmt)).scalar_one() == 0
+    stmt = select(func.count()).select_from(item_tags).where(item_tags.c.item_id == item.id)
+    assert (await session.execute(stmt)).scalar_one() == 0
+    # The tag itself belongs to the user, not the item
+    assert await session.get(Tag, tag.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_update_mark_keeps_images(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client, item_and_mark
+):
+    """Test the updated mark is returned with its images."""
+    item, mark = item_and_mark
+    session.add(
+        Image(
+            user_id=str(test_user.id),
+            mark_id=mark.id,
+            filename="test.jpg",
+            storage_key=f"marks/{mark.id}/test.jpg",
+            url="https://r2.example.com/test.jpg",
+            content_type="image/jpeg",
+            size_bytes=100,
+            position=0,
+        )
+    )
+    await session.commit()
+
+    response = await client.patch(f"/items/{item.id}/marks/{mark.id}", json={"title": "New"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "New"
+    assert [img["filename"] for img in data["images"]] == ["test.jpg"]
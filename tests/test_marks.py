@@ -1,5 +1,6 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Item, User
@@ -97,6 +98,30 @@ async def test_update_mark_not_found(
         json={"title": "X"},
     )
     assert response.status_code == 404
+    assert response.json()["detail"] == "Mark not found"
+
+
+@pytest.mark.asyncio
+async def test_update_mark_on_other_users_item(
+    client: AsyncClient, session: AsyncSession, test_user: User, other_user: User, auth_client
+):
+    """Test updating a mark on another user's item returns 404 for the item."""
+    other_item = Item(user_id=str(other_user.id), name="Other Item")
+    session.add(other_item)
+    await session.commit()
+    mark = Mark(item_id=other_item.id, title="Theirs")
+    session.add(mark)
+    await session.commit()
+
+    response = await client.patch(
+        f"/items/{other_item.id}/marks/{mark.id}",
+        json={"title": "Mine now"},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Item not found"
+
+    await session.refresh(mark)
+    assert mark.title == "Theirs"
 
 
 @pytest.mark.asyncio
@@ -121,6 +146,26 @@ async def test_delete_mark(
     assert response.json() == []
 
 
+@pytest.mark.asyncio
+async def test_delete_mark_on_other_users_item(
+    client: AsyncClient, session: AsyncSession, test_user: User, other_user: User, auth_client
+):
+    """Test deleting a mark on another user's item returns 404 and leaves it in place."""
+    other_item = Item(user_id=str(other_user.id), name="Other Item")
+    session.add(other_item)
+    await session.commit()
+    mark = Mark(item_id=other_item.id, title="Theirs")
+    session.add(mark)
+    await session.commit()
+
+    response = await client.delete(f"/items/{other_item.id}/marks/{mark.id}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Item not found"
+
+    result = await session.execute(select(Mark.id).where(Mark.id == mark.id))
+    assert result.scalar_one_or_none() == mark.id
+
+
 @pytest.mark.asyncio
 async def test_delete_mark_not_found(
     client: AsyncClient, session: AsyncSession, test_user: User, auth_client
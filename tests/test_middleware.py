@@ -0,0 +1,42 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_security_headers(client: AsyncClient):
+    """Test security headers are added to responses."""
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["strict-transport-security"] == "max-age=63072000; includeSubDomains"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+    assert response.headers["x-permitted-cross-domain-policies"] == "none"
+    assert response.headers["permissions-policy"] == "camera=(), microphone=(), geolocation=()"
+
+
+@pytest.mark.asyncio
+async def test_gzip_large_responses(client: AsyncClient):
+    """Test responses over the size threshold are gzipped and keep security headers."""
+    response = await client.get("/collection-types", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["x-frame-options"] == "DENY"
+
+    response = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_health_check_fast_path(client: AsyncClient):
+    """Test GET / and /health are answered directly with JSON bodies."""
+    response = await client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "message": "Trove API"}
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+    response = await client.get("/health")
+    assert response.json() == {"status": "healthy"}
+
+    response = await client.post("/health")
+    assert response.status_code == 404
@@ -0,0 +1,102 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.refresh import (
+    REFRESH_COOKIE_NAME,
+    REFRESH_TOKEN_LIFETIME,
+    cleanup_expired_tokens,
+    create_refresh_token,
+    set_refresh_cookie,
+    validate_and_rotate_refresh_token,
+)
+from app.config import COOKIE_SAMESITE, COOKIE_SECURE, settings
+from app.models import RefreshToken, User
+
+
+def _token(user: User, *, expired: bool = False, revoked: bool = False) -> RefreshToken:
+    offset = timedelta(days=-1) if expired else timedelta(days=1)
+    return RefreshToken(
+        id=uuid.uuid4(),
+        user_id=uuid.UUID(str(user.id)),
+        token_family=uuid.uuid4().hex,
+        is_revoked=revoked,
+        expires_at=datetime.now(UTC) + offset,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_tokens(session: AsyncSession, test_user: User):
+    """Test cleanup removes expired and revoked tokens and keeps active ones."""
+    active = _token(test_user)
+    session.add_all(
+        [
+            active,
+            _token(test_user, expired=True),
+            _token(test_user, revoked=True),
+        ]
+    )
+    await session.commit()
+
+    deleted = await cleanup_expired_tokens(session)
+    assert deleted == 2
+
+    result = await session.execute(select(RefreshToken.id))
+    assert result.scalars().all() == [active.id]
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token(session: AsyncSession, test_user: User):
+    """Test rotating a refresh token revokes it and issues a new one in the same family."""
+    token_jwt = await create_refresh_token(str(test_user.id), session)
+
+    result = await validate_and_rotate_refresh_token(token_jwt, session)
+    assert result is not None
+    user_id, new_jwt = result
+    assert user_id == str(test_user.id)
+    assert new_jwt != token_jwt
+
+    rows = (await session.execute(select(RefreshToken))).scalars().all()
+    assert len(rows) == 2
+    assert len({row.token_family for row in rows}) == 1
+    assert sorted(row.is_revoked for row in rows) == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_reused_refresh_token_revokes_family(session: AsyncSession, test_user: User):
+    """Test presenting an already-rotated token revokes the whole family."""
+    token_jwt = await create_refresh_token(str(test_user.id), session)
+    result = await validate_and_rotate_refresh_token(token_jwt, session)
+    assert result is not None
+
+    assert await validate_and_rotate_refresh_token(token_jwt, session) is None
+
+    rows = (await session.execute(select(RefreshToken))).scalars().all()
+    assert all(row.is_revoked for row in rows)
+
+    # The token issued by the legitimate rotation is now unusable too
+    assert await validate_and_rotate_refresh_token(result[1], session) is None
+
+
+def test_set_refresh_cookie_matches_starlette():
+    """Test the prebuilt refresh cookie header matches Response.set_cookie output."""
+    expected = Response()
+    expected.set_cookie(
+        key=REFRESH_COOKIE_NAME,
+        value="header.payload.signature",
+        max_age=int(REFRESH_TOKEN_LIFETIME.total_seconds()),
+        path="/auth/refresh",
+        domain=settings.cookie_domain,
+        secure=COOKIE_SECURE,
+        httponly=True,
+        samesite=COOKIE_SAMESITE,
+    )
+
+    response = Response()
+    set_refresh_cookie(response, "header.payload.signature")
+
+    assert response.headers.getlist("set-cookie") == expected.headers.getlist("set-cookie")
@@ -1,8 +1,10 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Tag, User
+from app.models import Item, Tag, User
+from app.models.tag import item_tags
 
 
 @pytest.mark.asyncio
@@ -76,6 +78,20 @@ async def test_update_tag_duplicate_name(
     assert response.status_code == 409
 
 
+@pytest.mark.asyncio
+async def test_update_tag_same_name(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client
+):
+    """Test renaming a tag to its current name succeeds."""
+    tag = Tag(user_id=str(test_user.id), name="Art")
+    session.add(tag)
+    await session.commit()
+
+    response = await client.patch(f"/tags/{tag.id}", json={"name": "Art"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Art"
+
+
 @pytest.mark.asyncio
 async def test_update_tag_not_found(client: AsyncClient, test_user: User, auth_client):
     """Test updating a non-existent tag returns 404."""
@@ -102,6 +118,28 @@ async def test_delete_tag(client: AsyncClient, session: AsyncSession, test_user:
     assert len(data) == 0
 
 
+@pytest.mark.asyncio
+async def test_delete_tag_removes_it_from_items(
+    client: AsyncClient, session: AsyncSession, test_user: User, auth_client
+):
+    """Test deleting a tag that is attached to an item."""
+    tag = Tag(user_id=str(test_user.id), name="Art")
+    item = Item(user_id=str(test_user.id), name="Item")
+    item.tags = [tag]
+    session.add(item)
+    await session.commit()
+
+    response = await client.delete(f"/tags/{tag.id}")
+    assert response.status_code == 204
+
+    response = await client.get(f"/items/{item.id}")
+    assert response.status_code == 200
+    assert response.json()["tags"] == []
+
+    result = await session.execute(select(func.count()).select_from(item_tags))
+    assert result.scalar_one() == 0
+
+
 @pytest.mark.asyncio
 async def test_delete_tag_not_found(client: AsyncClient, test_user: User, auth_client):
     """Test deleting a non-existent tag returns 404."""
@@ -152,3 +190,6 @@ async def test_cannot_delete_other_users_tag(
 
     response = await client.delete(f"/tags/{other_tag.id}")
     assert response.status_code == 404
+
+    await session.refresh(other_tag)
+    assert other_tag.name == "Other Tag"